@@ -0,0 +1,175 @@
+import json
+import time
+import logging
+from pathlib import Path
+
+from src.core.embeddings import EmbeddingGenerator
+from src.core.retriever import VectorStore
+from src.core.agent import ERROR_ANSWER, RAGAgent
+from evaluate import EVAL_QUERIES
+
+# Logging setup
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# (label, model_name, backend) - the first entry is the quality reference
+CONFIGS = [
+    ("flan-t5-large / pytorch", "google/flan-t5-large", "pytorch"),
+    ("flan-t5-base / pytorch", "google/flan-t5-base", "pytorch"),
+    ("flan-t5-large / quantized", "google/flan-t5-large", "quantized"),
+    ("flan-t5-large / onnx", "google/flan-t5-large", "onnx"),
+]
+
+INTRA_OP_THREADS = 4
+INTER_OP_THREADS = 1
+
+
+def token_f1(prediction: str, reference: str) -> float:
+    """Token-level F1 overlap between an answer and the reference answer"""
+    pred_tokens = prediction.lower().split()
+    ref_tokens = reference.lower().split()
+    if not pred_tokens or not ref_tokens:
+        return float(pred_tokens == ref_tokens)
+
+    ref_counts = {}
+    for token in ref_tokens:
+        ref_counts[token] = ref_counts.get(token, 0) + 1
+    common = 0
+    for token in pred_tokens:
+        if ref_counts.get(token, 0) > 0:
+            common += 1
+            ref_counts[token] -= 1
+    if common == 0:
+        return 0.0
+
+    precision = common / len(pred_tokens)
+    recall = common / len(ref_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def is_valid_response(response: dict) -> bool:
+    """A response only counts if generation succeeded on retrieved context"""
+    return response.get("answer") != ERROR_ANSWER and bool(response.get("retrieved_chunks"))
+
+
+def main():
+    logger.info("Starting generator backend benchmark")
+
+    # --- Shared components (mirror evaluate.py) ---
+    embedding_generator = EmbeddingGenerator(model_name="all-MiniLM-L6-v2")
+    vector_store = VectorStore(collection_name="test_collection")
+
+    # --- Ensure documents exist before loading any generator model ---
+    doc_dir = Path("sample_corpus")
+    if not doc_dir.exists() or not any(doc_dir.glob("*.txt")):
+        logger.error("No documents found. Please run run_demo.py first.")
+        return
+    indexed = vector_store.client.count(collection_name=vector_store.collection_name, exact=True).count
+    if indexed == 0:
+        logger.error(f"Collection '{vector_store.collection_name}' is empty. Please run run_demo.py first.")
+        return
+
+    reference_answers = None
+    summary = []
+    for index, (label, model_name, backend) in enumerate(CONFIGS):
+        start = time.time()
+        try:
+            agent = RAGAgent(
+                vector_store=vector_store,
+                embedding_generator=embedding_generator,
+                model_name=model_name,
+                backend=backend,
+                intra_op_threads=INTRA_OP_THREADS,
+                inter_op_threads=INTER_OP_THREADS,
+            )
+        except Exception as e:
+            logger.error(f"{label}: skipped, model failed to load: {e}")
+            summary.append({"config": label, "skipped": True, "error": str(e)})
+            continue
+
+        # On a cold ONNX cache the load time includes the one-time export
+        load_time = round(time.time() - start, 2)
+        export_time = getattr(agent.generator, "export_time_sec", None)
+
+        # Warm-up so one-time session/graph setup is not counted as query latency
+        agent.process_query(EVAL_QUERIES[0])
+
+        answers, latencies, failed_queries = [], [], []
+        for query in EVAL_QUERIES:
+            start = time.time()
+            response = agent.process_query(query)
+            elapsed = time.time() - start
+            if is_valid_response(response):
+                answers.append(response["answer"])
+                latencies.append(elapsed)
+            else:
+                logger.warning(f"{label}: no valid answer for query: {query}")
+                answers.append(None)
+                failed_queries.append(query)
+
+        # The first config is the quality reference
+        if index == 0:
+            reference_answers = answers
+        pairs = [
+            (a, r) for a, r in zip(answers, reference_answers or [])
+            if a is not None and r is not None
+        ]
+        f1_scores = [token_f1(a, r) for a, r in pairs]
+
+        result = {
+            "config": label,
+            "skipped": False,
+            "load_time_sec": load_time,
+            "export_time_sec": export_time,
+            "load_includes_export": export_time is not None,
+            "cache_hit": getattr(agent.generator, "cache_hit", None),
+            "mean_latency_sec": round(sum(latencies) / len(latencies), 2) if latencies else None,
+            "max_latency_sec": round(max(latencies), 2) if latencies else None,
+            "mean_f1_vs_reference": round(sum(f1_scores) / len(f1_scores), 3) if f1_scores else None,
+            "exact_match_vs_reference": sum(a == r for a, r in pairs) if pairs else None,
+            "compared_queries": len(pairs),
+            "failed_queries": failed_queries,
+            "answers": answers,
+        }
+        summary.append(result)
+        logger.info(
+            f"{label}: load {result['load_time_sec']}s, "
+            f"mean latency {result['mean_latency_sec']}s, "
+            f"F1 vs reference {result['mean_f1_vs_reference']}, "
+            f"{len(failed_queries)} failed queries"
+        )
+        del agent
+
+    # --- Print and save results ---
+    print(f"\n{'Config':<28}{'Load (s)':>10}{'Export (s)':>12}{'Mean (s)':>10}{'Max (s)':>10}"
+          f"{'F1':>8}{'EM':>8}{'Failed':>8}")
+    print("-" * 94)
+    for r in summary:
+        if r["skipped"]:
+            print(f"{r['config']:<28}  skipped: {r['error']}")
+            continue
+        export = "cached" if r["cache_hit"] else r["export_time_sec"]
+        print(
+            f"{r['config']:<28}{str(r['load_time_sec']) + ('*' if r['load_includes_export'] else ''):>10}"
+            f"{str(export if export is not None else '-'):>12}"
+            f"{str(r['mean_latency_sec']):>10}{str(r['max_latency_sec']):>10}"
+            f"{str(r['mean_f1_vs_reference']):>8}"
+            f"{str(r['exact_match_vs_reference']):>4}/{r['compared_queries']:<3}"
+            f"{len(r['failed_queries']):>8}"
+        )
+    if any(not r["skipped"] and r["load_includes_export"] for r in summary):
+        print("\n* Load time includes the one-time ONNX export; rerun with a warm cache to compare.")
+    if reference_answers is None:
+        print("\nReference config failed to load; quality scores are unavailable.")
+
+    output_file = Path("benchmark_results.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=4)
+
+    logger.info(f"Benchmark completed. Results saved to {output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import json
 import time
 import logging
@@ -24,13 +25,32 @@ EVAL_QUERIES = [
     "How does the system load documents, store embeddings, and answer queries step by step?"
 ]
 
+def parse_args() -> argparse.Namespace:
+    """Parse generator options for the evaluation run"""
+    parser = argparse.ArgumentParser(description="Evaluate the RAG prototype on test queries")
+    parser.add_argument("--model", default="google/flan-t5-large", help="Text2text model to generate answers with")
+    parser.add_argument("--backend", default="pytorch", choices=["pytorch", "quantized", "onnx"],
+                        help="Generator backend")
+    parser.add_argument("--intra-op-threads", type=int, default=None, help="Threads used within a single operator")
+    parser.add_argument("--inter-op-threads", type=int, default=None,
+                        help="Threads used to run independent operators in parallel")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     logger.info("Starting Evaluation of RAG Prototype")
 
     # --- Build components (mirror run_demo.py) ---
     embedding_generator = EmbeddingGenerator(model_name="all-MiniLM-L6-v2")
     vector_store = VectorStore(collection_name="test_collection")
-    agent = RAGAgent(vector_store=vector_store, embedding_generator=embedding_generator)
+    agent = RAGAgent(
+        vector_store=vector_store,
+        embedding_generator=embedding_generator,
+        model_name=args.model,
+        backend=args.backend,
+        intra_op_threads=args.intra_op_threads,
+        inter_op_threads=args.inter_op_threads,
+    )
 
     # --- Ensure documents exist (if collection is empty) ---
     doc_dir = Path("sample_corpus")
@@ -1,7 +1,9 @@
 # src/main.py
 
 import typer
+from enum import Enum
 from pathlib import Path
+from typing import Optional
 from loguru import logger
 
 from src.utils.logging import setup_logging
@@ -10,18 +12,40 @@ from src.utils.chunking import TextChunker
 from src.core.embeddings import EmbeddingGenerator
 from src.core.retriever import VectorStore
 from src.core.agent import RAGAgent
+from src.core.generator import GENERATOR_BACKENDS
 
 # Create CLI app
 app = typer.Typer()
 
-def initialize_components():
+# Backend choices validated by typer, built from the registered generator backends
+Backend = Enum("Backend", {name: name for name in GENERATOR_BACKENDS}, type=str)
+
+# Shared generator options for commands that answer queries
+MODEL_OPTION = typer.Option("google/flan-t5-large", "--model", help="Text2text model to generate answers with")
+BACKEND_OPTION = typer.Option(Backend.pytorch, "--backend", help="Generator backend: pytorch, quantized (int8) or onnx")
+INTRA_OP_OPTION = typer.Option(None, "--intra-op-threads", help="Threads used within a single operator")
+INTER_OP_OPTION = typer.Option(None, "--inter-op-threads", help="Threads used to run independent operators in parallel")
+
+def initialize_components(
+    model_name: str = "google/flan-t5-large",
+    backend: str = "pytorch",
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+):
     """Initialize all system components"""
     try:
         doc_loader = DocumentLoader()
         chunker = TextChunker(chunk_size=300, chunk_overlap=50)
         vector_store = VectorStore(collection_name="test_collection")
         embedding_generator = EmbeddingGenerator()
-        rag_agent = RAGAgent(vector_store, embedding_generator)
+        rag_agent = RAGAgent(
+            vector_store,
+            embedding_generator,
+            model_name=model_name,
+            backend=backend,
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=inter_op_threads,
+        )
         return doc_loader, chunker, embedding_generator, vector_store, rag_agent
     except Exception as e:
         logger.error(f"Failed to initialize components: {e}")
@@ -78,20 +102,31 @@ def ingest(doc_folder: str = typer.Argument(..., help="Folder containing documen
             logger.error(f"Failed to process {file.name}: {e}")
 
 @app.command()
-def process_query(query: str):
+def process_query(
+    query: str,
+    model: str = MODEL_OPTION,
+    backend: Backend = BACKEND_OPTION,
+    intra_op_threads: Optional[int] = INTRA_OP_OPTION,
+    inter_op_threads: Optional[int] = INTER_OP_OPTION,
+):
     """Process a single query"""
     setup_logging()
-    _, _, _, _, rag_agent = initialize_components()
+    _, _, _, _, rag_agent = initialize_components(model, backend.value, intra_op_threads, inter_op_threads)
     
     logger.info(f"Processing query: {query}")
     response = rag_agent.process_query(query)
     print(f"\nAgent Response: {response['answer']}")
 
 @app.command()
-def run_tests():
+def run_tests(
+    model: str = MODEL_OPTION,
+    backend: Backend = BACKEND_OPTION,
+    intra_op_threads: Optional[int] = INTRA_OP_OPTION,
+    inter_op_threads: Optional[int] = INTER_OP_OPTION,
+):
     """Run test scenarios"""
     setup_logging()
-    _, _, _, _, rag_agent = initialize_components()
+    _, _, _, _, rag_agent = initialize_components(model, backend.value, intra_op_threads, inter_op_threads)
     
     test_scenarios = [
         "What is the main purpose of the system described in the document?",
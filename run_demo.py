@@ -1,4 +1,5 @@
 from pathlib import Path
+import argparse
 import time
 from loguru import logger
 
@@ -108,7 +109,12 @@ def process_documents(doc_loader, chunker, embedding_generator, vector_store, fi
         return False
 
 
-def run_demo():
+def run_demo(
+    model_name: str = "google/flan-t5-base",
+    backend: str = "pytorch",
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+):
     """Run the full demo with ingestion and evaluation tests"""
     setup_logging()
     logger.info("Starting RAG Prototype Demo")
@@ -120,8 +126,16 @@ def run_demo():
         embedding_generator = EmbeddingGenerator()
         vector_store = VectorStore(collection_name="test_collection")
 
-        # Use flan-t5-base for faster inference (flan-t5-large is very slow on CPU)
-        rag_agent = RAGAgent(vector_store, embedding_generator, model_name="google/flan-t5-base")
+        # flan-t5-base by default; use --model google/flan-t5-large --backend onnx (or quantized)
+        # for large-model answers at CPU-friendly speed
+        rag_agent = RAGAgent(
+            vector_store,
+            embedding_generator,
+            model_name=model_name,
+            backend=backend,
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=inter_op_threads,
+        )
 
         demo_file = setup_demo_environment()
         if not demo_file:
@@ -170,5 +184,18 @@ def run_demo():
         raise
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse generator options for the demo"""
+    parser = argparse.ArgumentParser(description="Run the RAG prototype demo")
+    parser.add_argument("--model", default="google/flan-t5-base", help="Text2text model to generate answers with")
+    parser.add_argument("--backend", default="pytorch", choices=["pytorch", "quantized", "onnx"],
+                        help="Generator backend")
+    parser.add_argument("--intra-op-threads", type=int, default=None, help="Threads used within a single operator")
+    parser.add_argument("--inter-op-threads", type=int, default=None,
+                        help="Threads used to run independent operators in parallel")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    run_demo()
+    args = parse_args()
+    run_demo(args.model, args.backend, args.intra_op_threads, args.inter_op_threads)
@@ -1,30 +1,35 @@
 # src/core/agent.py
-from typing import Dict, List
+from typing import Dict, List, Optional
 from loguru import logger
-from transformers.pipelines import pipeline
 from src.core.embeddings import EmbeddingGenerator
+from src.core.generator import DEFAULT_CACHE_DIR, create_generator
 from src.core.retriever import VectorStore
 from src.utils.logging import log_retrieval_event
 
+ERROR_ANSWER = "Error processing your query."
+
 class RAGAgent:
     def __init__(
         self,
         vector_store: VectorStore,
         embedding_generator: EmbeddingGenerator,
-        model_name: str = "google/flan-t5-large"  # Use a compatible text2text model
-
+        model_name: str = "google/flan-t5-large",  # Use a compatible text2text model
+        backend: str = "pytorch",  # "pytorch", "quantized" (int8) or "onnx"
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,  # where the ONNX export is cached
     ):
         self.vector_store = vector_store
         self.embedding_generator = embedding_generator
 
         try:
             logger.info("Initializing text generation model...")
-            self.generator = pipeline(
-                "text2text-generation",
-                model=model_name,
-                max_length=512,
-                temperature=0.3,
-                do_sample=False,
+            self.generator = create_generator(
+                backend,
+                model_name,
+                intra_op_threads=intra_op_threads,
+                inter_op_threads=inter_op_threads,
+                cache_dir=cache_dir,
             )
 
             logger.info("Model initialized successfully.")
@@ -68,7 +73,7 @@ class RAGAgent:
                 return {"answer": "No relevant information found in documents."}
 
             prompt = self._format_prompt(query, context)
-            response = self.generator(prompt)[0]['generated_text']
+            response = self.generator.generate(prompt)
 
             logger.debug(f"Agent Generated Agent Response: {response.strip()}")
 
@@ -80,4 +85,4 @@ class RAGAgent:
 
         except Exception as e:
             logger.error(f"Error processing query: {e}")
-            return {"answer": "Error processing your query."}
+            return {"answer": ERROR_ANSWER}
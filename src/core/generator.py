@@ -0,0 +1,166 @@
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+import torch
+from loguru import logger
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+from transformers.pipelines import pipeline
+
+# Generation settings shared by every backend so answers stay comparable
+MAX_LENGTH = 512
+DEFAULT_CACHE_DIR = "model_cache"
+
+
+def _configure_torch_threads(intra_op_threads: Optional[int], inter_op_threads: Optional[int]):
+    """Apply torch CPU thread settings (inter-op can only be set once per process)"""
+    if intra_op_threads:
+        torch.set_num_threads(intra_op_threads)
+    if inter_op_threads:
+        try:
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError as e:
+            logger.warning(f"Could not set inter-op threads: {e}")
+
+
+class PipelineGenerator:
+    """Full-precision PyTorch `transformers` pipeline (original behaviour)"""
+
+    def __init__(
+        self,
+        model_name: str,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,  # unused: nothing is exported for this backend
+    ):
+        _configure_torch_threads(intra_op_threads, inter_op_threads)
+        self.pipeline = pipeline(
+            "text2text-generation",
+            model=model_name,
+            max_length=MAX_LENGTH,
+            temperature=0.3,
+            do_sample=False,
+        )
+
+    def generate(self, prompt: str) -> str:
+        return self.pipeline(prompt)[0]['generated_text']
+
+
+class QuantizedGenerator:
+    """PyTorch model with Linear layers dynamically quantized to int8"""
+
+    def __init__(
+        self,
+        model_name: str,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,  # unused: quantization is fast enough to redo per load
+    ):
+        _configure_torch_threads(intra_op_threads, inter_op_threads)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model.eval()
+        self.model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    def generate(self, prompt: str) -> str:
+        inputs = self.tokenizer(prompt, return_tensors="pt")
+        with torch.inference_mode():
+            output_ids = self.model.generate(
+                **inputs, max_length=MAX_LENGTH, do_sample=False, use_cache=True
+            )
+        return self.tokenizer.decode(output_ids[0], skip_special_tokens=True)
+
+
+class ONNXGenerator:
+    """ONNX Runtime export with decoder KV-cache reuse, exported once and cached on disk"""
+
+    def __init__(
+        self,
+        model_name: str,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+    ):
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+        session_options = ort.SessionOptions()
+        if intra_op_threads:
+            session_options.intra_op_num_threads = intra_op_threads
+        if inter_op_threads:
+            session_options.inter_op_num_threads = inter_op_threads
+            if inter_op_threads > 1:
+                session_options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        export_dir = Path(cache_dir) / (model_name.replace("/", "--") + "-onnx")
+        # export_dir is only ever created by the atomic rename below, so it exists
+        # exactly when a previous export completed
+        self.cache_hit = export_dir.exists()
+        self.export_time_sec = None
+
+        if self.cache_hit:
+            logger.info(f"Loading cached ONNX export from {export_dir}")
+            self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+            self.model = ORTModelForSeq2SeqLM.from_pretrained(
+                export_dir, use_cache=True, session_options=session_options
+            )
+            return
+
+        # Export into a sibling directory and only move it into place once complete,
+        # so an interrupted export never leaves a cache that looks valid
+        logger.info(f"Exporting {model_name} to ONNX at {export_dir} (one-time step)...")
+        start = time.time()
+        tmp_dir = export_dir.with_name(export_dir.name + ".tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        try:
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self.model = ORTModelForSeq2SeqLM.from_pretrained(
+                model_name, export=True, use_cache=True, session_options=session_options
+            )
+            self.model.save_pretrained(tmp_dir)
+            self.tokenizer.save_pretrained(tmp_dir)
+            tmp_dir.rename(export_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        self.export_time_sec = round(time.time() - start, 2)
+        logger.info(f"ONNX export finished in {self.export_time_sec}s")
+
+    def generate(self, prompt: str) -> str:
+        inputs = self.tokenizer(prompt, return_tensors="pt")
+        output_ids = self.model.generate(
+            **inputs, max_length=MAX_LENGTH, do_sample=False, use_cache=True
+        )
+        return self.tokenizer.decode(output_ids[0], skip_special_tokens=True)
+
+
+GENERATOR_BACKENDS = {
+    "pytorch": PipelineGenerator,
+    "quantized": QuantizedGenerator,
+    "onnx": ONNXGenerator,
+}
+
+
+def create_generator(
+    backend: str,
+    model_name: str,
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+):
+    """Build a text generator for the given backend ("pytorch", "quantized" or "onnx")"""
+    if backend not in GENERATOR_BACKENDS:
+        raise ValueError(
+            f"Unknown generator backend '{backend}'. "
+            f"Choose one of: {', '.join(GENERATOR_BACKENDS)}"
+        )
+    logger.info(f"Loading {model_name} with '{backend}' backend")
+    return GENERATOR_BACKENDS[backend](
+        model_name,
+        intra_op_threads=intra_op_threads,
+        inter_op_threads=inter_op_threads,
+        cache_dir=cache_dir,
+    )
@@ -0,0 +1,79 @@
+import src.core.agent as agent_module
+from src.core.agent import RAGAgent
+
+
+class StubGenerator:
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return "  Stub answer.  "
+
+
+class StubEmbeddingGenerator:
+    def generate_embeddings(self, texts):
+        return [[0.0] * 384 for _ in texts]
+
+
+class StubVectorStore:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def retrieve(self, query_embedding, limit=3, metadata_filter=None):
+        return self.docs[:limit]
+
+
+def build_agent(monkeypatch, docs, generator, **agent_kwargs):
+    calls = []
+
+    def fake_create_generator(*args, **kwargs):
+        calls.append((args, kwargs))
+        return generator
+
+    monkeypatch.setattr(agent_module, "create_generator", fake_create_generator)
+    agent = RAGAgent(StubVectorStore(docs), StubEmbeddingGenerator(), **agent_kwargs)
+    return agent, calls
+
+
+def test_agent_passes_generator_options_through(monkeypatch):
+    _, calls = build_agent(
+        monkeypatch,
+        [],
+        StubGenerator(),
+        model_name="google/flan-t5-large",
+        backend="onnx",
+        intra_op_threads=4,
+        inter_op_threads=2,
+        cache_dir="custom_cache",
+    )
+
+    assert calls == [(
+        ("onnx", "google/flan-t5-large"),
+        {"intra_op_threads": 4, "inter_op_threads": 2, "cache_dir": "custom_cache"},
+    )]
+
+
+def test_process_query_contract_with_pluggable_backend(monkeypatch):
+    docs = [{"text": "Documents are split into chunks."}, {"text": "Chunks are embedded."}]
+    generator = StubGenerator()
+    agent, _ = build_agent(monkeypatch, docs, generator, backend="onnx")
+
+    response = agent.process_query("How are documents processed?")
+
+    assert response == {
+        "answer": "Stub answer.",
+        "retrieved_chunks": [doc["text"] for doc in docs],
+        "context_used": docs[0]["text"],
+    }
+    assert "How are documents processed?" in generator.prompts[0]
+
+
+def test_process_query_without_context_skips_generation(monkeypatch):
+    generator = StubGenerator()
+    agent, _ = build_agent(monkeypatch, [], generator)
+
+    response = agent.process_query("Anything?")
+
+    assert response == {"answer": "No relevant information found in documents."}
+    assert generator.prompts == []
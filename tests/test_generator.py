@@ -0,0 +1,120 @@
+import sys
+import types
+
+import pytest
+
+import src.core.generator as generator_module
+from src.core.generator import ONNXGenerator, create_generator
+
+MODEL_NAME = "google/flan-t5-base"
+
+
+class FakeSessionOptions:
+    intra_op_num_threads = 0
+    inter_op_num_threads = 0
+    execution_mode = "sequential"
+
+
+class FakeSaveable:
+    def __init__(self, source, fail_on_save=False):
+        self.source = source
+        self.fail_on_save = fail_on_save
+
+    def save_pretrained(self, path):
+        path.mkdir(parents=True, exist_ok=True)
+        (path / f"{type(self).__name__}.saved").write_text(str(self.source))
+        if self.fail_on_save:
+            raise RuntimeError("disk full")
+
+
+class FakeORTModel(FakeSaveable):
+    calls = []
+    fail_on_save = False
+
+    @classmethod
+    def from_pretrained(cls, source, **kwargs):
+        cls.calls.append((source, kwargs))
+        return cls(source, fail_on_save=cls.fail_on_save)
+
+
+class FakeTokenizer(FakeSaveable):
+    @classmethod
+    def from_pretrained(cls, source):
+        return cls(source)
+
+
+@pytest.fixture
+def fake_ort(monkeypatch):
+    """Install fake onnxruntime / optimum modules so no model is downloaded"""
+    FakeORTModel.calls = []
+    FakeORTModel.fail_on_save = False
+
+    onnxruntime = types.ModuleType("onnxruntime")
+    onnxruntime.SessionOptions = FakeSessionOptions
+    onnxruntime.ExecutionMode = types.SimpleNamespace(ORT_PARALLEL="parallel")
+    optimum = types.ModuleType("optimum")
+    optimum_onnxruntime = types.ModuleType("optimum.onnxruntime")
+    optimum_onnxruntime.ORTModelForSeq2SeqLM = FakeORTModel
+    optimum.onnxruntime = optimum_onnxruntime
+
+    monkeypatch.setitem(sys.modules, "onnxruntime", onnxruntime)
+    monkeypatch.setitem(sys.modules, "optimum", optimum)
+    monkeypatch.setitem(sys.modules, "optimum.onnxruntime", optimum_onnxruntime)
+    monkeypatch.setattr(generator_module, "AutoTokenizer", FakeTokenizer)
+    return FakeORTModel
+
+
+def test_create_generator_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown generator backend"):
+        create_generator("bogus", MODEL_NAME)
+
+
+def test_onnx_first_use_exports_into_cache(fake_ort, tmp_path):
+    generator = ONNXGenerator(MODEL_NAME, intra_op_threads=4, inter_op_threads=1, cache_dir=str(tmp_path))
+
+    export_dir = tmp_path / "google--flan-t5-base-onnx"
+    assert generator.cache_hit is False
+    assert generator.export_time_sec is not None
+    assert (export_dir / "FakeORTModel.saved").exists()
+    assert (export_dir / "FakeTokenizer.saved").exists()
+    assert not export_dir.with_name(export_dir.name + ".tmp").exists()
+
+    # The exported model is reused, built once with the configured session options
+    assert len(fake_ort.calls) == 1
+    source, kwargs = fake_ort.calls[0]
+    assert source == MODEL_NAME
+    assert kwargs["export"] is True
+    assert kwargs["use_cache"] is True
+    options = kwargs["session_options"]
+    assert options.intra_op_num_threads == 4
+    assert options.inter_op_num_threads == 1
+    assert options.execution_mode == "sequential"
+
+
+def test_onnx_cache_hit_loads_export_without_exporting(fake_ort, tmp_path):
+    ONNXGenerator(MODEL_NAME, cache_dir=str(tmp_path))
+    fake_ort.calls.clear()
+
+    generator = ONNXGenerator(MODEL_NAME, inter_op_threads=2, cache_dir=str(tmp_path))
+
+    assert generator.cache_hit is True
+    assert generator.export_time_sec is None
+    assert len(fake_ort.calls) == 1
+    source, kwargs = fake_ort.calls[0]
+    assert source == tmp_path / "google--flan-t5-base-onnx"
+    assert "export" not in kwargs
+    assert kwargs["session_options"].execution_mode == "parallel"
+
+
+def test_onnx_failed_export_leaves_no_cache(fake_ort, tmp_path):
+    fake_ort.fail_on_save = True
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        ONNXGenerator(MODEL_NAME, cache_dir=str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+    # The next run exports again instead of trusting a half-written cache
+    fake_ort.fail_on_save = False
+    generator = ONNXGenerator(MODEL_NAME, cache_dir=str(tmp_path))
+    assert generator.cache_hit is False